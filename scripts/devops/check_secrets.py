@@ -19,20 +19,31 @@ Exit codes:
     2 - Error running wrangler
 """
 
-import argparse
 import json
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Set
-
-# Colors
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-RED = "\033[91m"
-CYAN = "\033[96m"
-DIM = "\033[2m"
-RESET = "\033[0m"
+from typing import Dict, FrozenSet, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+# Colors (blank when stdout is not a terminal, e.g. CI logs)
+if sys.stdout.isatty():
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    RED = "\033[91m"
+    CYAN = "\033[96m"
+    DIM = "\033[2m"
+    RESET = "\033[0m"
+else:
+    GREEN = YELLOW = RED = CYAN = DIM = RESET = ""
+
+_LOG_COLORS = {"info": CYAN, "success": GREEN, "warn": YELLOW, "error": RED, "dim": DIM}
 
 _WRANGLER_TIMEOUT = 30
 _CLI_SEPARATOR_WIDTH = 50
@@ -41,19 +52,42 @@ _CLI_SEPARATOR_WIDTH = 50
 # SECRETS CONFIGURATION
 # =============================================================================
 
+# Secret names per category, as frozensets: the check is pure set membership.
+# Descriptions live apart in SECRET_DESCRIPTIONS and are only read for reporting.
+
 # Required secrets - deployment fails if missing
-REQUIRED_SECRETS = {
-    "TALLY_WEBHOOK_SECRET": "Tally webhook authentication (URL param)",
-    "TEST_SECRET": "Test fixtures API authentication",
-}
+REQUIRED_SECRETS = frozenset({
+    "TALLY_WEBHOOK_SECRET",
+    "TEST_SECRET",
+})
 
 # Recommended secrets - warning if missing
-RECOMMENDED_SECRETS = {
-    "TALLY_SIGNING_SECRET": "Tally HMAC-SHA256 signature verification (preferred over webhook secret)",
-}
+RECOMMENDED_SECRETS = frozenset({
+    "TALLY_SIGNING_SECRET",
+})
 
 # Optional secrets - just informational
-OPTIONAL_SECRETS = {
+OPTIONAL_SECRETS = frozenset({
+    "CLOUDFLARE_ACCOUNT_ID",
+    "CLOUDFLARE_API_TOKEN",
+    "CF_ACCESS_CLIENT_ID",
+    "CF_ACCESS_CLIENT_SECRET",
+    "OPENAI_API_KEY",
+    "TALLY_API_KEY",
+    "UNIFIEDTO_API_TOKEN",
+    "UNIFIEDTO_CONNECTION_ID",
+    "UNIFIEDTO_WORKSPACE_ID",
+    "UNIFIEDTO_WORKSPACE_SECRET",
+    "MODAL_TOKEN_ID",
+    "MODAL_TOKEN_SECRET",
+    "USER_TRIGRAM",
+    "MHO_CALENDAR_EMAIL",
+})
+
+SECRET_DESCRIPTIONS = {
+    "TALLY_WEBHOOK_SECRET": "Tally webhook authentication (URL param)",
+    "TEST_SECRET": "Test fixtures API authentication",
+    "TALLY_SIGNING_SECRET": "Tally HMAC-SHA256 signature verification (preferred over webhook secret)",
     "CLOUDFLARE_ACCOUNT_ID": "For Cloudflare API operations",
     "CLOUDFLARE_API_TOKEN": "For Cloudflare deployments",
     "CF_ACCESS_CLIENT_ID": "Service token for API access",
@@ -82,16 +116,22 @@ def log(msg: str, level: str = "info") -> None:
         msg: Message text to display.
         level: Log level (info, success, warn, error, dim).
     """
-    colors = {"info": CYAN, "success": GREEN, "warn": YELLOW, "error": RED, "dim": DIM}
-    print(f"{colors.get(level, RESET)}{msg}{RESET}")
+    print(f"{_LOG_COLORS.get(level, RESET)}{msg}{RESET}")
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the LMS project root directory."""
-    return Path(__file__).parent.parent.parent
+    """Get the LMS project root directory (resolved once, symlinks followed)."""
+    return Path(__file__).resolve().parent.parent.parent
+
 
+# Successful `wrangler secret list` results per worker, so one process asking
+# twice (e.g. deploy.py checking several workers) spawns wrangler once each.
+# Failures are not cached: the next call retries.
+_configured_secrets_cache: Dict[Optional[str], FrozenSet[str]] = {}
 
-def get_configured_secrets(worker_name: Optional[str] = None) -> Set[str]:
+
+def get_configured_secrets(worker_name: Optional[str] = None) -> FrozenSet[str]:
     """
     Get list of configured secrets from Cloudflare Worker using wrangler.
 
@@ -99,11 +139,18 @@ def get_configured_secrets(worker_name: Optional[str] = None) -> Set[str]:
         worker_name: Optional worker name override.
 
     Returns:
-        Set of secret names currently configured in the worker.
+        Set of secret names currently configured in the worker (empty on error).
     """
+    cached = _configured_secrets_cache.get(worker_name)
+    if cached is not None:
+        return cached
+    
+    log("Fetching configured secrets from Cloudflare...")
     root = get_project_root()
     
-    cmd = ["npx", "wrangler", "secret", "list"]
+    # One wrangler spawn for all secrets; pin the JSON format so the output
+    # stays machine-readable regardless of wrangler's default.
+    cmd = ["npx", "wrangler", "secret", "list", "--format", "json"]
     if worker_name:
         cmd.extend(["--name", worker_name])
     
@@ -124,21 +171,23 @@ def get_configured_secrets(worker_name: Optional[str] = None) -> Set[str]:
                 log(f"❌ Worker not found. Deploy first or check worker name.", "error")
             else:
                 log(f"❌ Wrangler error: {result.stderr}", "error")
-            return set()
+            return frozenset()
         
         # Parse JSON output
-        secrets = json.loads(result.stdout)
-        return {s["name"] for s in secrets}
+        secrets = _json_loads(result.stdout.encode())
+        configured = frozenset(s["name"] for s in secrets)
+        _configured_secrets_cache[worker_name] = configured
+        return configured
         
     except json.JSONDecodeError as e:
         log(f"❌ Failed to parse wrangler output: {e}", "error")
-        return set()
+        return frozenset()
     except subprocess.TimeoutExpired:
         log("❌ Wrangler command timed out", "error")
-        return set()
+        return frozenset()
     except FileNotFoundError:
         log("❌ npx/wrangler not found. Install with: npm install -g wrangler", "error")
-        return set()
+        return frozenset()
 
 
 # =============================================================================
@@ -168,7 +217,6 @@ def check_secrets(worker_name: Optional[str] = None, verbose: bool = False) -> b
         log(f"Targeting worker: {worker_name}", "info")
 
     # Get configured secrets
-    log("Fetching configured secrets from Cloudflare...")
     configured = get_configured_secrets(worker_name)
     
     if not configured:
@@ -177,34 +225,25 @@ def check_secrets(worker_name: Optional[str] = None, verbose: bool = False) -> b
     
     log(f"Found {len(configured)} secrets configured\n", "success")
     
-    # Check required secrets
-    print(f"{CYAN}📋 Required secrets:{RESET}")
-    missing_required = []
-    for secret, description in REQUIRED_SECRETS.items():
-        if secret in configured:
-            print(f"   {GREEN}✅ {secret}{RESET}")
-        else:
-            print(f"   {RED}❌ {secret} - {description}{RESET}")
-            missing_required.append(secret)
+    # Missing names come straight from set difference; each block lists the
+    # configured secrets first, then the missing ones.
+    missing_required = sorted(REQUIRED_SECRETS - configured)
+    missing_recommended = sorted(RECOMMENDED_SECRETS - configured)
+    # (title, names, missing names, missing color, missing marker)
+    categories = [
+        ("Required", REQUIRED_SECRETS, missing_required, RED, "❌ "),
+        ("Recommended", RECOMMENDED_SECRETS, missing_recommended, YELLOW, "⚠️  "),
+    ]
+    if verbose:
+        categories.append(("Optional", OPTIONAL_SECRETS, sorted(OPTIONAL_SECRETS - configured), DIM, "○  "))
     
-    # Check recommended secrets
-    print(f"\n{CYAN}📋 Recommended secrets:{RESET}")
-    missing_recommended = []
-    for secret, description in RECOMMENDED_SECRETS.items():
-        if secret in configured:
+    for index, (title, names, missing, miss_color, miss_marker) in enumerate(categories):
+        header_gap = "\n" if index else ""
+        print(f"{header_gap}{CYAN}📋 {title} secrets:{RESET}")
+        for secret in sorted(names & configured):
             print(f"   {GREEN}✅ {secret}{RESET}")
-        else:
-            print(f"   {YELLOW}⚠️  {secret} - {description}{RESET}")
-            missing_recommended.append(secret)
-    
-    # Check optional secrets (verbose only)
-    if verbose:
-        print(f"\n{CYAN}📋 Optional secrets:{RESET}")
-        for secret, description in OPTIONAL_SECRETS.items():
-            if secret in configured:
-                print(f"   {GREEN}✅ {secret}{RESET}")
-            else:
-                print(f"   {DIM}○  {secret} - {description}{RESET}")
+        for secret in missing:
+            print(f"   {miss_color}{miss_marker}{secret} - {SECRET_DESCRIPTIONS[secret]}{RESET}")
     
     # Summary
     print()
@@ -226,6 +265,8 @@ def check_secrets(worker_name: Optional[str] = None, verbose: bool = False) -> b
 
 def main() -> None:
     """ Parse CLI args and verify Cloudflare Worker secrets are configured."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Check Cloudflare Worker secrets configuration",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -14,11 +14,22 @@ One-liner (in Dev Container):
     cd 04.Execution/lms && python scripts/devops/deploy.py --frontend
 """
 
-import argparse
+import os
+import signal
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Sibling scripts, run in-process rather than through a new interpreter.
+# Put this directory on the path so they resolve however deploy.py is invoked
+# (`python -m`, runpy, imported from another script...).
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from check_secrets import check_secrets as check_worker_secrets
+from verify_deploy import verify_all
+
 # Colors
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
@@ -36,6 +47,16 @@ _SUBPROCESS_TIMEOUT = 120
 _CLI_SEPARATOR_WIDTH = 50
 
 
+# Backend and frontend deploy concurrently: serialize console writes
+_output_lock = threading.Lock()
+
+
+def emit(text: str) -> None:
+    """Print a block of text without interleaving with other deploy threads."""
+    with _output_lock:
+        print(text)
+
+
 def log(msg: str, level: str = "info") -> None:
     """Print colored log message.
 
@@ -44,26 +65,78 @@ def log(msg: str, level: str = "info") -> None:
         level: Log level (info, success, warn, error).
     """
     colors = {"info": CYAN, "success": GREEN, "warn": YELLOW, "error": RED}
-    print(f"{colors.get(level, RESET)}{msg}{RESET}")
+    emit(f"{colors.get(level, RESET)}{msg}{RESET}")
+
+
+def _kill_process_group(proc: subprocess.Popen[str]) -> None:
+    """Kill a process started with start_new_session=True and all its children.
+
+    `npx` runs wrangler as a `node` grandchild that inherits the output pipe;
+    killing only `npx` would leave the pipe open and readers blocked.
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # already exited
+
+
+def _stream_cmd(cmd: list[str], cwd: Path | None, label: str) -> subprocess.CompletedProcess[str]:
+    """Run a command, echoing its merged stdout/stderr line by line.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command outlives _SUBPROCESS_TIMEOUT.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=cwd, bufsize=1,
+                            start_new_session=True)
+    timed_out = threading.Event()
 
+    def _kill() -> None:
+        timed_out.set()
+        _kill_process_group(proc)
 
-def run_cmd(cmd: list[str], cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess[str]:
+    # Reading blocks while the command is silent, so the deadline runs on a timer
+    timer = threading.Timer(_SUBPROCESS_TIMEOUT, _kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            emit(f"   [{label}] {line.rstrip()}")
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        # Own session, so Ctrl-C doesn't reach the command: stop it ourselves
+        if proc.poll() is None:
+            _kill_process_group(proc)
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, _SUBPROCESS_TIMEOUT)
+    return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr="")
+
+
+def run_cmd(
+    cmd: list[str], cwd: Path | None = None, check: bool = True, stream_label: str | None = None
+) -> subprocess.CompletedProcess[str]:
     """Run a command with error handling.
 
     Args:
         cmd: Command and arguments list.
         cwd: Working directory for the subprocess.
         check: If True, exit on non-zero return code.
+        stream_label: If set, show the command's output live (prefixed with
+            this label) instead of capturing it; stdout/stderr are then empty.
 
     Returns:
         Completed process result.
     """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, timeout=_SUBPROCESS_TIMEOUT, check=False)
+        if stream_label is None:
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, timeout=_SUBPROCESS_TIMEOUT, check=False)
+        else:
+            result = _stream_cmd(cmd, cwd, stream_label)
         if check and result.returncode != 0:
             log(f"❌ Command failed: {' '.join(cmd)}", "error")
             if result.stderr:
-                print(result.stderr)
+                emit(result.stderr)
             sys.exit(1)
         return result
     except subprocess.TimeoutExpired:
@@ -74,24 +147,58 @@ def run_cmd(cmd: list[str], cwd: Path | None = None, check: bool = True) -> subp
         sys.exit(1)
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
-    """Get the LMS project root directory."""
-    return Path(__file__).parent.parent.parent
+    """Get the LMS project root directory (resolved once, symlinks followed)."""
+    return Path(__file__).resolve().parent.parent.parent
 
 
 def check_secrets() -> bool:
     """Run secrets check script."""
     log("🔐 Checking secrets...")
-    script = Path(__file__).parent / "check_secrets.py"
-    result = subprocess.run([sys.executable, str(script)], capture_output=False, check=True)
-    return result.returncode == 0
+    return check_worker_secrets()
+
+
+_D1_LIST_CMD = ["npx", "wrangler", "d1", "list"]
 
 
-def setup_database(skip: bool = False) -> bool:
+def start_d1_list() -> subprocess.Popen[str]:
+    """Start `wrangler d1 list` in the background; collect it with read_d1_list().
+
+    A plain process (not a worker thread) so it can be killed if the deploy
+    aborts before its output is needed.
+    """
+    try:
+        return subprocess.Popen(_D1_LIST_CMD, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, cwd=get_project_root(), start_new_session=True)
+    except FileNotFoundError:
+        log(f"❌ Command not found: {_D1_LIST_CMD[0]}", "error")
+        sys.exit(1)
+
+
+def read_d1_list(proc: subprocess.Popen[str]) -> str:
+    """Wait for a start_d1_list() process and return its output (empty on failure)."""
+    try:
+        stdout, _ = proc.communicate(timeout=_SUBPROCESS_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        proc.communicate()
+        log(f"❌ Command timed out: {' '.join(_D1_LIST_CMD)}", "error")
+        sys.exit(1)
+    return stdout if proc.returncode == 0 else ""
+
+
+def list_d1_databases() -> str:
+    """Return the raw `wrangler d1 list` output (empty on failure)."""
+    return read_d1_list(start_d1_list())
+
+
+def setup_database(skip: bool = False, d1_list: str | None = None) -> bool:
     """Set up D1 database and apply schema.
 
     Args:
         skip: If True, skip database setup entirely.
+        d1_list: Output of list_d1_databases() if already fetched.
 
     Returns:
         True if database is ready.
@@ -103,17 +210,18 @@ def setup_database(skip: bool = False) -> bool:
     root = get_project_root()
     
     log("📦 Checking D1 database...")
-    result = run_cmd(["npx", "wrangler", "d1", "list"], cwd=root, check=False)
+    if d1_list is None:
+        d1_list = list_d1_databases()
     
-    if "lms-db" not in result.stdout:
+    if "lms-db" not in d1_list:
         log("Creating database 'lms-db'...")
-        run_cmd(["npx", "wrangler", "d1", "create", "lms-db"], cwd=root)
+        run_cmd(["npx", "wrangler", "d1", "create", "lms-db"], cwd=root, stream_label="d1")
         log("⚠️  Update wrangler.toml with the new database_id!", "warn")
         return False
     
     log("📦 Applying schema...")
     run_cmd(["npx", "wrangler", "d1", "execute", "lms-db", 
-             "--file=db/schema.sql", "--remote"], cwd=root)
+             "--file=db/schema.sql", "--remote"], cwd=root, stream_label="d1")
     log("✅ Schema applied", "success")
     return True
 
@@ -133,18 +241,16 @@ def deploy_backend() -> bool:
     log("📦 Applying D1 migrations to remote lms-db...")
     migrate_result = run_cmd(
         ["npx", "wrangler", "d1", "migrations", "apply", "lms-db", "--remote"],
-        cwd=root, check=False,
+        cwd=root, check=False, stream_label=BACKEND_WORKER,
     )
     if migrate_result.returncode != 0:
         log(f"❌ D1 migrations apply failed", "error")
-        print(migrate_result.stderr)
         return False
     log(f"✅ D1 migrations applied", "success")
 
-    result = run_cmd(["npx", "wrangler", "deploy"], cwd=root, check=False)
+    result = run_cmd(["npx", "wrangler", "deploy"], cwd=root, check=False, stream_label=BACKEND_WORKER)
     if result.returncode != 0:
         log(f"❌ Backend deploy failed", "error")
-        print(result.stderr)
         return False
 
     log(f"✅ Backend deployed: {BACKEND_URL}", "success")
@@ -176,28 +282,42 @@ def deploy_frontend() -> bool:
     result = run_cmd([
         "npx", "wrangler", "deploy",
         "-c", str(wrangler_toml)
-    ], cwd=frontend_dir, check=False)
+    ], cwd=frontend_dir, check=False, stream_label=FRONTEND_WORKER)
     
     if result.returncode != 0:
         log(f"❌ Frontend deploy failed", "error")
-        print(result.stderr)
         return False
     
     log(f"✅ Frontend deployed: {FRONTEND_URL}", "success")
     return True
 
 
+def deploy_workers(backend: bool, frontend: bool) -> bool:
+    """Deploy the requested Workers, concurrently when both are requested.
+
+    The two `wrangler deploy` uploads are independent Cloudflare API calls,
+    so they overlap instead of running back to back. Database setup must
+    happen before this step (the backend deploy depends on it).
+
+    Args:
+        backend: Deploy the backend Worker API.
+        frontend: Deploy the frontend Worker.
+
+    Returns:
+        True if every requested deploy succeeded.
+    """
+    steps = [step for step, wanted in ((deploy_backend, backend), (deploy_frontend, frontend)) if wanted]
+    if not steps:
+        return True
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = [executor.submit(step) for step in steps]
+        return all([future.result() for future in futures])
+
+
 def verify_deployment() -> bool:
     """Verify both deployments are healthy."""
     log("🔍 Verifying deployments...")
-    script = Path(__file__).parent / "verify_deploy.py"
-    
-    if script.exists():
-        result = subprocess.run([sys.executable, str(script)], check=True)
-        return result.returncode == 0
-    else:
-        log("⚠️  verify_deploy.py not found", "warn")
-        return True
+    return verify_all()
 
 
 def seed_courses() -> bool:
@@ -221,6 +341,8 @@ def seed_courses() -> bool:
 
 def main() -> None:
     """ Deploy LMS backend and frontend to Cloudflare Workers."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="LMS Deployment Script")
     parser.add_argument("--backend", action="store_true", help="Deploy backend only")
     parser.add_argument("--frontend", action="store_true", help="Deploy frontend only")
@@ -237,30 +359,28 @@ def main() -> None:
     print(f"{CYAN}🚀 LMS Deployment Script{RESET}")
     print(f"{CYAN}{'='*50}{RESET}\n")
     
-    # Step 1: Check secrets
+    setup_db = (deploy_both or args.backend) and not args.skip_db
+    
+    # Step 1: Check secrets, with `wrangler d1 list` overlapping it in the background
+    d1_list_proc = start_d1_list() if setup_db else None
     if not args.skip_secrets:
         if not check_secrets():
+            if d1_list_proc is not None:
+                _kill_process_group(d1_list_proc)  # don't leave wrangler running
             log("❌ Fix secrets and retry", "error")
             sys.exit(1)
         print()
     
     # Step 2: Database setup (only for backend)
-    if (deploy_both or args.backend) and not args.skip_db:
-        if not setup_database():
+    if setup_db:
+        if not setup_database(d1_list=read_d1_list(d1_list_proc)):
             sys.exit(1)
         print()
     
-    # Step 3: Deploy backend
-    if deploy_both or args.backend:
-        if not deploy_backend():
-            sys.exit(1)
-        print()
-    
-    # Step 4: Deploy frontend
-    if deploy_both or args.frontend:
-        if not deploy_frontend():
-            sys.exit(1)
-        print()
+    # Step 3-4: Deploy backend + frontend (in parallel when both)
+    if not deploy_workers(backend=deploy_both or args.backend, frontend=deploy_both or args.frontend):
+        sys.exit(1)
+    print()
     
     # Step 5: Verify
     if not args.skip_verify:
@@ -12,8 +12,10 @@ One-liner (in Dev Container):
 
 import http.client
 import json
+import re
 import ssl
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Tuple
 
 # Configuration. Static hostnames + paths — no dynamic URL construction.
@@ -33,6 +35,15 @@ _HTTP_STATUS_OK = 200
 _HTTP_STATUS_REDIRECT = 302
 _CLI_SEPARATOR_WIDTH = 50
 
+# Body markers, scanned once over the raw bytes (no decode + lower() copies).
+_HTML_MARKER_RE = re.compile(rb"<html|<!doctype", re.IGNORECASE)
+_BRAND_MARKER_RE = re.compile(rb"TPB Academy|LMS")
+
+
+# One TLS context (CA bundle loaded once) shared by every check. Each host is
+# fetched once per run, so connections are not kept alive.
+_SSL_CONTEXT = ssl.create_default_context()
+
 
 def _https_get(host: str, path: str) -> Tuple[int, bytes]:
     """Issue HTTPS GET against a STATIC host + path.
@@ -40,8 +51,7 @@ def _https_get(host: str, path: str) -> Tuple[int, bytes]:
     Returns `(status, body)`. Raises on any transport error. Uses
     `http.client.HTTPSConnection` per § CF ACCESS (no urllib).
     """
-    ctx = ssl.create_default_context()
-    conn = http.client.HTTPSConnection(host, timeout=_HTTP_TIMEOUT, context=ctx)
+    conn = http.client.HTTPSConnection(host, timeout=_HTTP_TIMEOUT, context=_SSL_CONTEXT)
     try:
         conn.request("GET", path, headers={"User-Agent": "LMS-Deploy-Check"})
         resp = conn.getresponse()
@@ -57,12 +67,16 @@ CYAN = "\033[96m"
 RESET = "\033[0m"
 
 
-def check_backend() -> bool:
-    """Check backend API health endpoint."""
+def check_backend(response: "Future[Tuple[int, bytes]]") -> bool:
+    """Check backend API health endpoint.
+
+    Args:
+        response: Pending `_https_get` of the health endpoint.
+    """
     print(f"{CYAN}🔍 Checking backend: {BACKEND_URL}{RESET}")
 
     try:
-        status, body = _https_get(_BACKEND_HOST, _BACKEND_HEALTH_PATH)
+        status, body = response.result()
         if status != _HTTP_STATUS_OK:
             print(f"{RED}   ❌ HTTP {status}{RESET}")
             return False
@@ -87,12 +101,16 @@ def check_backend() -> bool:
     return False
 
 
-def check_frontend() -> bool:
-    """Check frontend is serving HTML."""
+def check_frontend(response: "Future[Tuple[int, bytes]]") -> bool:
+    """Check frontend is serving HTML.
+
+    Args:
+        response: Pending `_https_get` of the frontend root.
+    """
     print(f"{CYAN}🔍 Checking frontend: {FRONTEND_URL}{RESET}")
 
     try:
-        status, body = _https_get(_FRONTEND_HOST, _FRONTEND_ROOT_PATH)
+        status, body = response.result()
     except (ssl.SSLError, TimeoutError, OSError, http.client.HTTPException) as e:
         print(f"{RED}   ❌ Error: {e}{RESET}")
         return False
@@ -105,33 +123,44 @@ def check_frontend() -> bool:
         print(f"{RED}   ❌ HTTP {status}{RESET}")
         return False
 
-    content = body.decode(errors="replace")
-    if "<html" in content.lower() or "<!doctype" in content.lower():
+    if _HTML_MARKER_RE.search(body):
         print(f"{GREEN}   ✅ Serving HTML{RESET}")
-        if "TPB Academy" in content or "LMS" in content:
+        if _BRAND_MARKER_RE.search(body):
             print(f"{GREEN}   ✅ Content verified{RESET}")
         return True
     print(f"{YELLOW}   ⚠️  Unexpected content{RESET}")
     return True
 
 
-def main() -> None:
-    """ Verify backend API and frontend deployments are healthy."""
+def verify_all() -> bool:
+    """Run every deployment check and print the report.
+
+    Returns:
+        True if both backend and frontend checks passed.
+    """
     print(f"\n{CYAN}{'=' * _CLI_SEPARATOR_WIDTH}{RESET}")
     print(f"{CYAN}🔍 LMS Deployment Verification{RESET}")
     print(f"{CYAN}{'='*50}{RESET}\n")
     
-    backend_ok = check_backend()
-    print()
-    frontend_ok = check_frontend()
-    print()
+    # Both GETs hit different hosts: fetch them in parallel, report in order
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend_response = executor.submit(_https_get, _BACKEND_HOST, _BACKEND_HEALTH_PATH)
+        frontend_response = executor.submit(_https_get, _FRONTEND_HOST, _FRONTEND_ROOT_PATH)
+        backend_ok = check_backend(backend_response)
+        print()
+        frontend_ok = check_frontend(frontend_response)
+        print()
     
     if backend_ok and frontend_ok:
         print(f"{GREEN}✅ All checks passed{RESET}")
-        sys.exit(0)
-    else:
-        print(f"{RED}❌ Some checks failed{RESET}")
-        sys.exit(1)
+        return True
+    print(f"{RED}❌ Some checks failed{RESET}")
+    return False
+
+
+def main() -> None:
+    """ Verify backend API and frontend deployments are healthy."""
+    sys.exit(0 if verify_all() else 1)
 
 
 if __name__ == "__main__":
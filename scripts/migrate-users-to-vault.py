@@ -19,12 +19,29 @@ becomes the SSOT for IAM and hris_employee is no longer used for roles.
 import json
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 import httpx
 from tpb_sdk.bastion import BastionClient
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
 _CLI_SEPARATOR_WIDTH = 50
+# Concurrent employee migrations; each is a few network-bound vault-api calls
+_MIGRATION_WORKERS = 16
+# Print a progress line every N finished employees
+_PROGRESS_EVERY = 25
+
+# email → vault user id for the 409 (already exists) fallback; re-listed on a miss
+_user_ids_by_email: dict[str, str] | None = None
+_user_ids_lock = threading.Lock()
+_print_lock = threading.Lock()
 
 
 def get_bastion_client() -> BastionClient:
@@ -42,7 +59,7 @@ def get_bastion_client() -> BastionClient:
 
 def fetch_lms_employees() -> list[dict[str, Any]]:
     """Fetch employees from LMS D1 database."""
-    print("📊 Fetching employees from LMS database...")
+    print("📊 Fetching employees from LMS database...", flush=True)
 
     sql = """
     SELECT
@@ -67,7 +84,7 @@ def fetch_lms_employees() -> list[dict[str, Any]]:
 
     try:
         # Parse wrangler output
-        output = json.loads(result.stdout)
+        output = _json_loads(result.stdout)
         # Wrangler returns array with result object
         if isinstance(output, list) and len(output) > 0:
             results = output[0].get('results', [])
@@ -91,13 +108,33 @@ def get_vault_groups(client: BastionClient) -> dict[str, str]:
     groups = client.list_groups()
     return {g['name']: g['id'] for g in groups}
 
-def create_vault_user(client: BastionClient, email: str, display_name: str) -> str | None:
+def find_existing_user_id(client: BastionClient, email: str) -> str | None:
+    """Look up an existing vault-api user's id by email (after a 409).
+
+    Users are listed once per run; a miss re-lists them once, since another
+    worker may have created the user (duplicate email) after the snapshot.
+
+    Args:
+        client: Authenticated BastionClient.
+        email: User email address.
+
+    Returns:
+        User ID string, or None if no user has that email.
+    """
+    global _user_ids_by_email
+    with _user_ids_lock:
+        if _user_ids_by_email is None or email not in _user_ids_by_email:
+            _user_ids_by_email = {u.get('email'): u['id'] for u in client.list_users()}
+        return _user_ids_by_email.get(email)
+
+def create_vault_user(client: BastionClient, email: str, display_name: str, log: list[str]) -> str | None:
     """Create user in vault-api via the SDK.
 
     Args:
         client: Authenticated BastionClient.
         email: User email address.
         display_name: Human-readable name for the user.
+        log: Output lines for this employee (printed as one block).
 
     Returns:
         User ID string if created or found, None on failure.
@@ -113,14 +150,11 @@ def create_vault_user(client: BastionClient, email: str, display_name: str) -> s
         return created['id'] if isinstance(created, dict) and 'id' in created else None
     except httpx.HTTPStatusError as exc:
         if exc.response.status_code == 409:
-            for user in client.list_users():
-                if user.get('email') == email:
-                    return user['id']
-            return None
-        print(f"      ❌ create_user failed: {exc.response.status_code}")
+            return find_existing_user_id(client, email)
+        log.append(f"      ❌ create_user failed: {exc.response.status_code}")
         return None
 
-def add_user_to_group(client: BastionClient, user_id: str, group_id: str, group_name: str) -> bool:
+def add_user_to_group(client: BastionClient, user_id: str, group_id: str, group_name: str, log: list[str]) -> bool:
     """Add user to vault-api group via the SDK.
 
     Args:
@@ -128,6 +162,7 @@ def add_user_to_group(client: BastionClient, user_id: str, group_id: str, group_
         user_id: Vault user identifier.
         group_id: Vault group identifier.
         group_name: Group name for logging.
+        log: Output lines for this employee (printed as one block).
 
     Returns:
         True if user was added or already a member.
@@ -138,12 +173,15 @@ def add_user_to_group(client: BastionClient, user_id: str, group_id: str, group_
     except httpx.HTTPStatusError as exc:
         if exc.response.status_code == 409:
             return True
-        print(f"      ❌ Failed to add to {group_name}: {exc.response.status_code}")
+        log.append(f"      ❌ Failed to add to {group_name}: {exc.response.status_code}")
         return False
 
 def migrate_employee(client: BastionClient, employee: dict[str, Any], groups: dict[str, str]) -> dict[str, str] | None:
     """Migrate a single employee to vault-api.
 
+    Safe to run concurrently: the employee's output is collected and printed
+    as one block so parallel migrations don't interleave.
+
     Args:
         client: Authenticated BastionClient.
         employee: Employee record dict from LMS database.
@@ -154,7 +192,7 @@ def migrate_employee(client: BastionClient, employee: dict[str, Any], groups: di
     """
     # Parse email
     try:
-        emails = json.loads(employee.get('emails_json', '[]'))
+        emails = _json_loads(employee.get('emails_json', '[]'))
         if not emails:
             return None
         email = emails[0].get('email')
@@ -166,7 +204,7 @@ def migrate_employee(client: BastionClient, employee: dict[str, Any], groups: di
 
     # Parse roles
     try:
-        roles = json.loads(employee.get('employee_roles_json', '[]'))
+        roles = _json_loads(employee.get('employee_roles_json', '[]'))
     except json.JSONDecodeError:
         roles = []
 
@@ -181,23 +219,26 @@ def migrate_employee(client: BastionClient, employee: dict[str, Any], groups: di
 
     display_name = employee.get('name', email.split('@')[0])
 
-    print(f"  👤 {email} ({lms_role})")
-
-    # 1. Create user in vault-api
-    user_id = create_vault_user(client, email, display_name)
-    if not user_id:
-        print(f"      ❌ Failed to create user")
-        return None
+    log = [f"  👤 {email} ({lms_role})"]
+    try:
+        # 1. Create user in vault-api
+        user_id = create_vault_user(client, email, display_name, log)
+        if not user_id:
+            log.append(f"      ❌ Failed to create user")
+            return None
 
-    print(f"      ✅ User: {user_id}")
+        log.append(f"      ✅ User: {user_id}")
 
-    # 2. Add to appropriate group
-    group_id = groups.get(target_group)
-    if group_id:
-        if add_user_to_group(client, user_id, group_id, target_group):
-            print(f"      ✅ Added to {target_group}")
-    else:
-        print(f"      ⚠️  Group {target_group} not found")
+        # 2. Add to appropriate group
+        group_id = groups.get(target_group)
+        if group_id:
+            if add_user_to_group(client, user_id, group_id, target_group, log):
+                log.append(f"      ✅ Added to {target_group}")
+        else:
+            log.append(f"      ⚠️  Group {target_group} not found")
+    finally:
+        with _print_lock:
+            print("\n".join(log))
 
     return {
         'email': email,
@@ -208,13 +249,17 @@ def migrate_employee(client: BastionClient, employee: dict[str, Any], groups: di
 
 def main() -> None:
     """ Migrate LMS employees to vault-api users and group memberships."""
+    # Block-buffer stdout: each employee block is flushed once when it
+    # completes, not one write(2) per line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("🚀 Migrating LMS users to vault-api...")
     client = get_bastion_client()
     print(f"   Target: {client.base_url}")
     print()
 
     # 1. Fetch existing vault groups
-    print("📋 Fetching vault-api groups...")
+    print("📋 Fetching vault-api groups...", flush=True)
     groups = get_vault_groups(client)
     print(f"   Found groups: {list(groups.keys())}")
     print()
@@ -231,14 +276,32 @@ def main() -> None:
 
     print()
 
-    # 3. Migrate each employee
-    print("🔄 Migrating employees...")
+    # 3. Migrate employees concurrently (one shared client = pooled connections)
+    print("🔄 Migrating employees...", flush=True)
     results = []
-
-    for emp in employees:
-        result = migrate_employee(client, emp, groups)
-        if result:
-            results.append(result)
+    failures = []
+    with ThreadPoolExecutor(max_workers=_MIGRATION_WORKERS) as executor:
+        futures = {executor.submit(migrate_employee, client, emp, groups): emp for emp in employees}
+        # Handle each employee as soon as it finishes, not in submission order
+        for done, future in enumerate(as_completed(futures), start=1):
+            # The worker already printed this employee's block: flush it now,
+            # one write per employee rather than per line
+            sys.stdout.flush()
+            try:
+                result = future.result()
+            except Exception as exc:
+                # One employee's unexpected error (transport, SDK payload...)
+                # must not abort the others or skip the summary.
+                employee = futures[future]
+                failures.append(employee.get('id'))
+                with _print_lock:
+                    print(f"  ❌ {employee.get('name') or employee.get('id')}: {type(exc).__name__}: {exc}", flush=True)
+                continue
+            if result:
+                results.append(result)
+            if done % _PROGRESS_EVERY == 0 and done < len(futures):
+                with _print_lock:
+                    print(f"   … {done}/{len(futures)} processed ({len(results)} migrated)", flush=True)
 
     print()
 
@@ -248,6 +311,8 @@ def main() -> None:
     print("=" * _CLI_SEPARATOR_WIDTH)
     print(f"   Total employees: {len(employees)}")
     print(f"   Successfully migrated: {len(results)}")
+    if failures:
+        print(f"   Errored: {len(failures)} ({', '.join(str(f) for f in failures)})")
     print()
 
     if results:
@@ -263,6 +328,11 @@ def main() -> None:
             print(f"      • {i['email']}")
 
     print()
+    if failures:
+        # Non-zero exit so callers/CI don't take a partial run for a success
+        print(f"❌ Migration incomplete: {len(failures)} employee(s) errored, re-run after fixing")
+        sys.exit(1)
+
     print("✅ Migration complete!")
     print()
     print("🎯 Next steps:")
@@ -18,11 +18,28 @@ Usage:
 
 import argparse
 import json
+import os
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
 _CLI_SEPARATOR_WIDTH = 50
+# UPDATEs sent per `wrangler d1 execute --file` call (one Node spawn + one round-trip each)
+_UPDATE_BATCH_SIZE = 100
 
 
 def run_d1_query(sql: str, cwd: Path | None = None) -> dict[str, Any]:
@@ -56,32 +73,38 @@ def run_d1_query(sql: str, cwd: Path | None = None) -> dict[str, Any]:
         return {"results": []}
     
     try:
-        data = json.loads(output[json_start:])
+        data = _json_loads(output[json_start:])
         return data[0] if data else {"results": []}
     except json.JSONDecodeError:
         return {"results": []}
 
 
-def run_d1_command(sql: str, cwd: Path | None = None) -> bool:
-    """Execute a D1 command (INSERT/UPDATE) via wrangler.
+def run_d1_file(statements: list[str], cwd: Path | None = None) -> bool:
+    """Execute several D1 statements in a single wrangler call via --file.
 
     Args:
-        sql: SQL command string to execute.
+        statements: SQL statements (without trailing semicolons).
         cwd: Working directory for the wrangler command.
 
     Returns:
-        True if the command succeeded.
+        True if the whole file was applied.
     """
+    with tempfile.NamedTemporaryFile("w", suffix=".sql", encoding="utf-8", delete=False) as sql_file:
+        sql_file.write(";\n".join(statement.strip() for statement in statements) + ";\n")
+    
     cmd = [
         "npx", "wrangler", "d1", "execute", "lms-db", "--remote",
-        "--command", sql
+        "--file", sql_file.name
     ]
     
-    result = subprocess.run(
-        cmd, 
-        capture_output=True, 
-        text=True, 
-        cwd=cwd or Path(__file__).parent.parent, check=True)
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            cwd=cwd or Path(__file__).parent.parent, check=False)
+    finally:
+        os.unlink(sql_file.name)
     
     if result.returncode != 0:
         print(f"⚠️ Command failed: {result.stderr}")
@@ -90,6 +113,22 @@ def run_d1_command(sql: str, cwd: Path | None = None) -> bool:
     return True
 
 
+def sql_literal(value: str) -> str:
+    """Quote a string as a SQLite literal.
+
+    `wrangler d1 execute` takes no bind parameters for --command/--file, so
+    values are inlined; doubling single quotes is the only escaping SQLite
+    string literals need.
+
+    Args:
+        value: Raw string value.
+
+    Returns:
+        The value wrapped in single quotes, safe to inline in SQL.
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
 def fetch_classes() -> list[dict[str, Any]]:
     """Fetch all lms_class records."""
     sql = """
@@ -103,14 +142,17 @@ def fetch_classes() -> list[dict[str, Any]]:
 
 
 def migrate_class(cls: dict[str, Any], dry_run: bool = True) -> dict[str, Any]:
-    """Migrate a single class to unified.to format.
+    """Compute the unified.to migration for a single class.
+
+    The UPDATE is not executed here: it is returned under "sql" so main()
+    can apply all of them in batched wrangler calls.
 
     Args:
         cls: Class record dict from the database.
-        dry_run: If True, preview changes without applying.
+        dry_run: If True, print the planned changes; otherwise just queue.
 
     Returns:
-        Result dict with class ID, changes list, and status.
+        Result dict with class ID, changes list, and the UPDATE statement.
     """
     class_id = cls["id"]
     
@@ -119,12 +161,12 @@ def migrate_class(cls: dict[str, Any], dry_run: bool = True) -> dict[str, Any]:
     raw_json = cls.get("raw_json") or "{}"
     
     try:
-        media = json.loads(media_json) if isinstance(media_json, str) else media_json
+        media = _json_loads(media_json) if isinstance(media_json, str) else media_json
     except json.JSONDecodeError:
         media = []
     
     try:
-        raw = json.loads(raw_json) if isinstance(raw_json, str) else raw_json
+        raw = _json_loads(raw_json) if isinstance(raw_json, str) else raw_json
     except json.JSONDecodeError:
         raw = {}
     
@@ -163,35 +205,48 @@ def migrate_class(cls: dict[str, Any], dry_run: bool = True) -> dict[str, Any]:
     if not changes:
         return {"id": class_id, "changes": [], "skipped": True}
     
-    # Build UPDATE SQL
-    new_raw_json = json.dumps(raw, ensure_ascii=False)
-    new_media_json = json.dumps(updated_media, ensure_ascii=False)
-    
-    # Escape single quotes for SQL
-    new_raw_json_escaped = new_raw_json.replace("'", "''")
-    new_media_json_escaped = new_media_json.replace("'", "''")
+    # Build UPDATE SQL (every value goes through sql_literal, id included)
+    new_raw_json = _json_dumps(raw)
+    new_media_json = _json_dumps(updated_media)
     
     sql = f"""
         UPDATE lms_class 
-        SET raw_json = '{new_raw_json_escaped}',
-            media_json = '{new_media_json_escaped}',
+        SET raw_json = {sql_literal(new_raw_json)},
+            media_json = {sql_literal(new_media_json)},
             updated_at = datetime('now')
-        WHERE id = '{class_id}'
+        WHERE id = {sql_literal(class_id)}
     """
     
     if dry_run:
-        print(f"\n📝 {class_id}:")
-        for change in changes:
-            print(f"   • {change}")
+        print(f"\n📝 {class_id}:\n" + "\n".join(f"   • {change}" for change in changes))
     else:
-        print(f"\n🔄 Migrating {class_id}...")
-        if run_d1_command(sql):
-            print(f"   ✓ Updated ({len(changes)} changes)")
-        else:
-            print(f"   ✗ Failed")
-            return {"id": class_id, "changes": changes, "error": True}
+        print(f"🔄 Queued {class_id} ({len(changes)} changes)")
+    
+    return {"id": class_id, "changes": changes, "sql": sql}
+
+
+def apply_updates(results: list[dict[str, Any]]) -> None:
+    """Apply queued UPDATEs in batches, flagging every class of a failed batch.
+
+    D1 rejects explicit BEGIN/COMMIT, so batches are bounded by size rather
+    than wrapped in transactions.
+
+    Args:
+        results: migrate_class() results; entries with "sql" are applied.
+    """
+    pending = [r for r in results if r.get("sql")]
+    if not pending:
+        return
     
-    return {"id": class_id, "changes": changes}
+    print(f"\n🔄 Applying {len(pending)} updates in batches of {_UPDATE_BATCH_SIZE}...", flush=True)
+    for start in range(0, len(pending), _UPDATE_BATCH_SIZE):
+        batch = pending[start:start + _UPDATE_BATCH_SIZE]
+        if run_d1_file([r["sql"] for r in batch]):
+            print(f"   ✓ Updated {len(batch)} classes", flush=True)
+        else:
+            print(f"   ✗ Batch of {len(batch)} classes failed", flush=True)
+            for r in batch:
+                r["error"] = True
 
 
 def main() -> int:
@@ -205,6 +260,10 @@ def main() -> int:
         print("❌ Please specify --dry-run or --execute")
         return 1
     
+    # Block-buffer stdout: per-class lines are flushed at the slow steps below,
+    # not one write(2) per line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("🔄 LMS Unified.to Migration")
     print("=" * _CLI_SEPARATOR_WIDTH)
     
@@ -214,7 +273,7 @@ def main() -> int:
         print("⚠️  EXECUTING - Changes will be applied to database\n")
     
     # Fetch all classes
-    print("📥 Fetching classes from D1...")
+    print("📥 Fetching classes from D1...", flush=True)
     try:
         classes = fetch_classes()
     except (RuntimeError, subprocess.SubprocessError, OSError) as e:
@@ -229,6 +288,9 @@ def main() -> int:
         result = migrate_class(cls, dry_run=args.dry_run)
         results.append(result)
     
+    if not args.dry_run:
+        apply_updates(results)
+    
     # Summary
     print("\n" + "=" * 50)
     migrated = [r for r in results if not r.get("skipped")]
@@ -75,28 +75,31 @@ def main() -> int:
 
     results = []
     counts = {"loom_public": 0, "loom_private": [], "yt_public": 0, "yt_unavailable": [], "probe_error": []}
-    for i, v in enumerate(vids):
-        status = probe(httpx.Client(), v)
-        results.append({**v, "status": status})
-        ok = status == 200
-        if v["kind"] == "loom":
-            if ok:
-                counts["loom_public"] += 1
-            elif status is None:
-                counts["probe_error"].append(v["url"])
-            else:
-                counts["loom_private"].append({"lesson": v["lesson"], "url": v["url"], "status": status})
-        elif v["kind"] == "youtube":
-            if ok:
-                counts["yt_public"] += 1
-            elif status is None:
-                counts["probe_error"].append(v["url"])
-            else:
-                counts["yt_unavailable"].append({"lesson": v["lesson"], "url": v["url"], "status": status})
-        if (i + 1) % 50 == 0:
-            print(f"  …{i + 1}/{len(vids)}")
-        if args.sleep_ms:
-            time.sleep(args.sleep_ms / 1000.0)
+    # One client for the whole sweep: keep-alive to the two oEmbed hosts instead
+    # of a TLS handshake (and a leaked connection pool) per video.
+    with httpx.Client() as cl:
+        for i, v in enumerate(vids):
+            status = probe(cl, v)
+            results.append({**v, "status": status})
+            ok = status == 200
+            if v["kind"] == "loom":
+                if ok:
+                    counts["loom_public"] += 1
+                elif status is None:
+                    counts["probe_error"].append(v["url"])
+                else:
+                    counts["loom_private"].append({"lesson": v["lesson"], "url": v["url"], "status": status})
+            elif v["kind"] == "youtube":
+                if ok:
+                    counts["yt_public"] += 1
+                elif status is None:
+                    counts["probe_error"].append(v["url"])
+                else:
+                    counts["yt_unavailable"].append({"lesson": v["lesson"], "url": v["url"], "status": status})
+            if (i + 1) % 50 == 0:
+                print(f"  …{i + 1}/{len(vids)}")
+            if args.sleep_ms:
+                time.sleep(args.sleep_ms / 1000.0)
 
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -46,6 +46,18 @@ def _get_access_credentials():
     return _get_access_credentials._cache
 
 
+def _get_seed_headers():
+    """Headers for /api/test/seed, built once (Content-Type comes from `json=`)."""
+    if not hasattr(_get_seed_headers, "_cache"):
+        creds = _get_access_credentials()
+        _get_seed_headers._cache = {
+            "CF-Access-Client-Id": creds["client_id"],
+            "CF-Access-Client-Secret": creds["client_secret"],
+            "X-Test-Secret": TEST_SECRET,
+        }
+    return _get_seed_headers._cache
+
+
 # Test Secret (for /api/test/seed endpoint) - not really sensitive
 TEST_SECRET = "lms_test_4e440fd30d7b4ed5ae22ff701e380f2e"
 
@@ -109,14 +121,6 @@ def apply_fixture(fixture: str, user_id: str, email: str = None, api_base: str =
     if email:
         print(f"   Email: {email}")
     
-    creds = _get_access_credentials()
-    headers = {
-        "CF-Access-Client-Id": creds["client_id"],
-        "CF-Access-Client-Secret": creds["client_secret"],
-        "X-Test-Secret": TEST_SECRET,
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "fixture": fixture,
         "user_id": user_id
@@ -130,7 +134,7 @@ def apply_fixture(fixture: str, user_id: str, email: str = None, api_base: str =
         resp = requests.post(
             f"{api_base}/api/test/seed",
             json=payload,
-            headers=headers,
+            headers=_get_seed_headers(),
             timeout=_FIXTURE_TIMEOUT
         )
         
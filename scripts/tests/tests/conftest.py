@@ -9,6 +9,12 @@ Credentials are fetched from bastion via BastionClient.
 No hardcoded secrets or .env files needed.
 """
 
+import http.cookiejar
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from tpb_sdk.bastion import BastionClient
 
 # ============================================
@@ -24,15 +30,93 @@ API_BASE = PROD_URL
 # Test timeout
 TIMEOUT = 10
 
-# Bastion client singleton
+# Max body chars echoed in a failed status assertion
+_FAILURE_BODY_PREVIEW = 200
+
+# HTTP connection pool (all tests hit the same host)
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 20
+
+# Bastion client singleton. Credentials are bootstrapped once per process;
+# the lock keeps concurrent tests from each triggering their own bastion auth.
 _vault = None
+_credentials_lock = threading.RLock()
 
 def get_vault():
     """Get or create BastionClient singleton."""
     global _vault
-    if _vault is None:
-        _vault = BastionClient.from_devcontainer()
-    return _vault
+    with _credentials_lock:
+        if _vault is None:
+            _vault = BastionClient.from_devcontainer()
+        return _vault
+
+# ============================================
+# HTTP Session (keep-alive + connection pooling)
+# ============================================
+
+# Shared session singleton: one TLS handshake reused across the whole suite
+# instead of a fresh connection per `requests.get(...)`.
+# Tests run from a thread pool, so creation is guarded by a lock.
+_http = None
+_http_lock = threading.Lock()
+
+def get_http():
+    """Get or create the shared requests.Session."""
+    global _http
+    with _http_lock:
+        if _http is None:
+            _http = requests.Session()
+            adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+            _http.mount("https://", adapter)
+            _http.mount("http://", adapter)
+            # Never store cookies: a CF_Authorization cookie from an authenticated
+            # test would make the anonymous auth-enforcement probes authenticated.
+            _http.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        return _http
+
+
+# Read-only GETs probed by several tests (signals, admin stats...) are fetched
+# and JSON-decoded once per run. Keyed on (url, role); a per-key lock makes
+# concurrent callers wait for the in-flight request instead of repeating it.
+_json_cache = {}
+_json_key_locks = {}
+_json_cache_lock = threading.Lock()
+
+def cached_get_json(url, profile):
+    """GET `url` as `profile` once per run and share the result.
+
+    A failed request is not cached: it raises for that caller and the next
+    one retries.
+
+    Args:
+        url: Absolute endpoint URL.
+        profile: Test profile (anything with `role` and `headers()`).
+
+    Returns:
+        Tuple of (status_code, data); data is None if the body is not JSON.
+    """
+    key = (url, profile.role)
+    with _json_cache_lock:
+        key_lock = _json_key_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        if key not in _json_cache:
+            response = get_http().get(url, headers=profile.headers(), timeout=TIMEOUT)
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+            _json_cache[key] = (response.status_code, data)
+        return _json_cache[key]
+
+
+def close_http():
+    """Close the shared session (end of run)."""
+    global _http
+    if _http is not None:
+        _http.close()
+        _http = None
+    _json_cache.clear()
+    _json_key_locks.clear()
 
 # ============================================
 # API Key Authentication (for API consumers)
@@ -44,23 +128,24 @@ _api_keys = None
 def _load_api_keys():
     """Load API keys from vault."""
     global _api_keys
-    if _api_keys is not None:
+    with _credentials_lock:
+        if _api_keys is not None:
+            return _api_keys
+        
+        vault = get_vault()
+        _api_keys = {
+            'student': vault.get_secret('tpb/apps/lms/test_api_key_student'),
+            'instructor': vault.get_secret('tpb/apps/lms/test_api_key_instructor'),
+            'admin': vault.get_secret('tpb/apps/lms/test_api_key_admin'),
+        }
+        
+        # Validate we have all keys
+        missing = [k for k, v in _api_keys.items() if not v]
+        if missing:
+            print(f"WARNING: Missing API keys in vault for roles: {missing}")
+            print("Store them with: vault.set_secret('tpb/apps/lms/test_api_key_{role}', 'tpb_...')")
+        
         return _api_keys
-    
-    vault = get_vault()
-    _api_keys = {
-        'student': vault.get_secret('tpb/apps/lms/test_api_key_student'),
-        'instructor': vault.get_secret('tpb/apps/lms/test_api_key_instructor'),
-        'admin': vault.get_secret('tpb/apps/lms/test_api_key_admin'),
-    }
-    
-    # Validate we have all keys
-    missing = [k for k, v in _api_keys.items() if not v]
-    if missing:
-        print(f"WARNING: Missing API keys in vault for roles: {missing}")
-        print("Store them with: vault.set_secret('tpb/apps/lms/test_api_key_{role}', 'tpb_...')")
-    
-    return _api_keys
 
 
 def get_api_key_headers(role='student'):
@@ -92,27 +177,28 @@ _cf_tokens = None
 def _load_cf_tokens():
     """Load CF Access tokens from vault."""
     global _cf_tokens
-    if _cf_tokens is not None:
-        return _cf_tokens
-    
-    vault = get_vault()
-    
-    # LMS app credentials for CF Access
-    _cf_tokens = {
-        'lms': {
-            'id': vault.get_secret('tpb/apps/lms/vault_client_id'),
-            'secret': vault.get_secret('tpb/apps/lms/vault_client_secret'),
+    with _credentials_lock:
+        if _cf_tokens is not None:
+            return _cf_tokens
+        
+        vault = get_vault()
+        
+        # LMS app credentials for CF Access
+        _cf_tokens = {
+            'lms': {
+                'id': vault.get_secret('tpb/apps/lms/vault_client_id'),
+                'secret': vault.get_secret('tpb/apps/lms/vault_client_secret'),
+            }
         }
-    }
-    
-    # Validate
-    if not _cf_tokens['lms']['id'] or not _cf_tokens['lms']['secret']:
-        print("WARNING: Missing LMS CF Access credentials in vault")
-        print("Store them with:")
-        print("  vault.set_secret('tpb/apps/lms/vault_client_id', '...')")
-        print("  vault.set_secret('tpb/apps/lms/vault_client_secret', '...')")
-    
-    return _cf_tokens
+        
+        # Validate
+        if not _cf_tokens['lms']['id'] or not _cf_tokens['lms']['secret']:
+            print("WARNING: Missing LMS CF Access credentials in vault")
+            print("Store them with:")
+            print("  vault.set_secret('tpb/apps/lms/vault_client_id', '...')")
+            print("  vault.set_secret('tpb/apps/lms/vault_client_secret', '...')")
+        
+        return _cf_tokens
 
 
 def get_cf_access_headers():
@@ -147,6 +233,22 @@ def get_api_base():
     return API_BASE
 
 
+# ============================================
+# Assertion Helpers
+# ============================================
+
+def assert_status(response, *expected):
+    """Assert the response status is one of `expected`.
+
+    The failure message names the request and truncates the body, so a large
+    payload never floods the console.
+    """
+    assert response.status_code in expected, (
+        f"Expected {'/'.join(map(str, expected))}, got {response.status_code} "
+        f"({response.request.method} {response.url}): {response.text[:_FAILURE_BODY_PREVIEW]}"
+    )
+
+
 # ============================================
 # Logging Helpers
 # ============================================
@@ -10,9 +10,7 @@ Each profile uses its own API key linked to a user with the correct role.
 Role resolution happens via vault-api based on the user's email/group membership.
 """
 
-import requests
-
-from .conftest import API_KEYS, TIMEOUT, get_api_base, get_api_key_headers, log_info
+from .conftest import TIMEOUT, get_api_base, get_api_key_headers, get_http, log_info
 
 
 class Profile:
@@ -23,10 +21,13 @@ class Profile:
         self.role = role
         self.email = email
         self._cached_session = None
+        self._cached_headers = None
     
     def headers(self):
-        """Get auth headers for this profile."""
-        return get_api_key_headers(self.role)
+        """Get auth headers for this profile (resolved from vault once)."""
+        if self._cached_headers is None:
+            self._cached_headers = get_api_key_headers(self.role)
+        return self._cached_headers
     
     def get_session(self, force_refresh=False):
         """Get session info from API for this profile."""
@@ -34,7 +35,7 @@ class Profile:
             return self._cached_session
         
         try:
-            resp = requests.get(
+            resp = get_http().get(
                 f"{get_api_base()}/api/learner",
                 headers=self.headers(),
                 timeout=TIMEOUT
@@ -20,6 +20,7 @@ Usage:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add parent directory to path for imports
@@ -40,7 +41,9 @@ from tests.conftest import (
     LOCAL_URL,
     PROD_URL,
     Colors,
+    close_http,
     get_api_base,
+    get_http,
     log_fail,
     log_info,
     log_pass,
@@ -51,14 +54,37 @@ from tests.conftest import (
 from tests.profiles import Profiles
 
 _CLI_SEPARATOR_WIDTH = 60
+# Tests are independent IO-bound HTTP probes: run them concurrently.
+_MAX_WORKERS = 16
+# Fail-fast reachability probe: abort instead of letting every test time out
+_HEALTH_TIMEOUT = 2
+_EXIT_API_UNREACHABLE = 2
 
 
-def run_test_module(module_name, tests):
-    """Run a list of tests and return (passed, failed) counts.
+def _run_test(test_fn):
+    """Run a single test without printing.
+
+    Args:
+        test_fn: Test callable raising on failure.
+
+    Returns:
+        None on success, error message on failure.
+    """
+    try:
+        test_fn()
+        return None
+    except AssertionError as e:
+        return str(e)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def run_test_module(module_name, results):
+    """Report the results of a test module and return (passed, failed) counts.
 
     Args:
         module_name: Display name for the test module section.
-        tests: List of (name, test_fn) tuples to execute.
+        results: List of (name, future) tuples, future resolving to `_run_test`'s result.
 
     Returns:
         Tuple of (passed_count, failed_count).
@@ -68,27 +94,40 @@ def run_test_module(module_name, tests):
     passed = 0
     failed = 0
     
-    for name, test_fn in tests:
-        try:
-            test_fn()
+    for name, future in results:
+        error = future.result()
+        if error is None:
             log_pass(name)
             passed += 1
-        except AssertionError as e:
-            log_fail(name, str(e))
-            failed += 1
-        except Exception as e:
-            log_fail(name, f"{type(e).__name__}: {e}")
+        else:
+            log_fail(name, error)
             failed += 1
     
     return passed, failed
 
 
+def check_api_reachable():
+    """Exit early if the API health endpoint does not answer 200 quickly."""
+    try:
+        response = get_http().get(f"{get_api_base()}/api/health", timeout=_HEALTH_TIMEOUT)
+        if response.status_code == 200:
+            return
+        reason = f"HTTP {response.status_code}"
+    except Exception as e:
+        reason = f"{type(e).__name__}: {e}"
+    log_fail("API unreachable, aborting", reason)
+    close_http()
+    sys.exit(_EXIT_API_UNREACHABLE)
+
+
 def run_all_tests():
     """Run all test modules."""
     print(f"\n🧪 {Colors.CYAN}LMS API Tests - Pentest Style{Colors.END}")
     print(f"   Target: {get_api_base()}")
     print(f"   Timestamp: {datetime.now().isoformat()}")
     
+    check_api_reachable()
+    
     # Detect current role for informational purposes
     try:
         role = Profiles.get_current_role()
@@ -111,10 +150,19 @@ def run_all_tests():
         ("ENTROPY CHECKS", test_07_entropy.get_tests()),
     ]
     
-    for module_name, tests in modules:
-        passed, failed = run_test_module(module_name, tests)
-        total_passed += passed
-        total_failed += failed
+    # Submit everything up front, then report module by module in order
+    try:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            scheduled = [
+                (module_name, [(name, executor.submit(_run_test, test_fn)) for name, test_fn in tests])
+                for module_name, tests in modules
+            ]
+            for module_name, results in scheduled:
+                passed, failed = run_test_module(module_name, results)
+                total_passed += passed
+                total_failed += failed
+    finally:
+        close_http()
     
     # Summary
     print(f"\n{'=' * _CLI_SEPARATOR_WIDTH}")
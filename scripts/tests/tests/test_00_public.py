@@ -4,18 +4,22 @@ Public Endpoint Tests - No Authentication Required
 Tests endpoints that should be accessible without any auth.
 """
 
-import requests
-
-from .conftest import TIMEOUT, get_api_base
+from .conftest import TIMEOUT, assert_status, get_api_base, get_http
 
 
 class TestPublicEndpoints:
     """Tests for publicly accessible endpoints."""
 
+    def __init__(self):
+        # Endpoint URLs built once per run
+        base = get_api_base()
+        self.url_health = f"{base}/api/health"
+        self.url_unknown = f"{base}/api/nonexistent-endpoint-xyz"
+
     def test_health_check(self):
         """API should respond to health check with DB status."""
-        response = requests.get(f"{get_api_base()}/api/health", timeout=TIMEOUT)
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        response = get_http().get(self.url_health, timeout=TIMEOUT)
+        assert_status(response, 200)
         
         data = response.json()
         assert data["status"] in ["healthy", "ok"], f"Status: {data['status']}"
@@ -28,7 +32,7 @@ class TestPublicEndpoints:
 
     def test_health_response_format(self):
         """Health response should have proper JSON structure."""
-        response = requests.get(f"{get_api_base()}/api/health", timeout=TIMEOUT)
+        response = get_http().get(self.url_health, timeout=TIMEOUT)
         data = response.json()
         
         required_fields = ["status", "timestamp", "version"]
@@ -37,22 +41,22 @@ class TestPublicEndpoints:
 
     def test_cors_preflight(self):
         """API should return CORS headers on OPTIONS."""
-        response = requests.options(
-            f"{get_api_base()}/api/health",
+        response = get_http().options(
+            self.url_health,
             headers={"Origin": "https://example.com"},
             timeout=TIMEOUT
         )
-        assert response.status_code == 204, f"Expected 204, got {response.status_code}"
+        assert_status(response, 204)
 
     def test_unknown_endpoint_requires_auth(self):
         """Unknown endpoints should require auth (401 or 302 redirect to CF Access)."""
-        response = requests.get(
-            f"{get_api_base()}/api/nonexistent-endpoint-xyz",
+        response = get_http().get(
+            self.url_unknown,
             timeout=TIMEOUT,
             allow_redirects=False
         )
         # Worker returns 401 directly, or CF Access returns 302 redirect
-        assert response.status_code in [401, 302], f"Expected 401/302, got {response.status_code}"
+        assert_status(response, 401, 302)
 
 
 def get_tests():
@@ -14,90 +14,85 @@ Students should NOT be able to:
 - View other students' data (tested in isolation tests)
 """
 
-import requests
-
-from .conftest import TIMEOUT, get_api_base, log_info
+from .conftest import TIMEOUT, assert_status, cached_get_json, get_api_base, get_http, log_info
 from .profiles import ADMIN, STUDENT
 
 
 class TestRBACStudent:
     """RBAC tests from student perspective."""
 
+    def __init__(self):
+        # Endpoint URLs built once per run
+        base = get_api_base()
+        self.url_courses = f"{base}/api/courses"
+        self.url_courses_wge_onboarding = f"{base}/api/courses/wge-onboarding"
+        self.url_signals_wge_onboarding = f"{base}/api/signals/wge-onboarding"
+        self.url_badges = f"{base}/api/badges"
+        self.url_leaderboard = f"{base}/api/leaderboard"
+        self.url_learner = f"{base}/api/learner"
+        self.url_admin_stats = f"{base}/api/admin/stats"
+
     def test_student_can_view_courses(self):
         """Student can view available courses."""
-        response = requests.get(
-            f"{get_api_base()}/api/courses",
+        response = get_http().get(
+            self.url_courses,
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
         data = response.json()
         assert "courses" in data or isinstance(data, list)
 
     def test_student_can_view_course_details(self):
         """Student can view course details."""
-        response = requests.get(
-            f"{get_api_base()}/api/courses/wge-onboarding",
+        response = get_http().get(
+            self.url_courses_wge_onboarding,
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
         # 200 if exists, 404 if not - both are valid responses
-        assert response.status_code in [200, 404], f"Expected 200/404, got {response.status_code}"
+        assert_status(response, 200, 404)
 
     def test_student_can_view_signals(self):
         """Student can view their own course signals/progress."""
-        response = requests.get(
-            f"{get_api_base()}/api/signals/wge-onboarding",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        data = response.json()
+        status, data = cached_get_json(self.url_signals_wge_onboarding, STUDENT)
+        assert status == 200, f"Expected 200, got {status}"
         # Should have steps array
         assert "steps" in data or "signals" in data or isinstance(data, dict)
 
     def test_student_can_view_badges(self):
         """Student can view badges."""
-        response = requests.get(
-            f"{get_api_base()}/api/badges",
+        response = get_http().get(
+            self.url_badges,
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
         data = response.json()
         assert "badges" in data or isinstance(data, list)
 
     def test_student_can_view_leaderboard(self):
         """Student can view the leaderboard."""
-        response = requests.get(
-            f"{get_api_base()}/api/leaderboard",
+        response = get_http().get(
+            self.url_leaderboard,
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
         data = response.json()
         assert "leaderboard" in data or isinstance(data, list)
 
     def test_student_can_view_own_profile(self):
         """Student can view their own learner profile."""
-        response = requests.get(
-            f"{get_api_base()}/api/learner",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
+        status, _ = cached_get_json(self.url_learner, STUDENT)
         # 200 or 404 if no profile yet
-        assert response.status_code in [200, 404], f"Expected 200/404, got {response.status_code}"
+        assert status in [200, 404], f"Expected 200/404, got {status}"
 
     def test_student_cannot_access_admin_stats(self):
         """Student should NOT be able to access admin stats (403)."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 403, \
-            f"Student should get 403 on admin stats, got {response.status_code}"
-        data = response.json()
+        status, data = cached_get_json(self.url_admin_stats, STUDENT)
+        assert status == 403, \
+            f"Student should get 403 on admin stats, got {status}"
         assert "error" in data
 
 
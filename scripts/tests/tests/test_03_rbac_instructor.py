@@ -10,53 +10,55 @@ Instructors should NOT be able to:
 - Access admin-only endpoints
 """
 
-import requests
-
-from .conftest import TIMEOUT, get_api_base, log_info
+from .conftest import TIMEOUT, assert_status, cached_get_json, get_api_base, get_http, log_info
 from .profiles import INSTRUCTOR
 
 
 class TestRBACInstructor:
     """RBAC tests from instructor perspective."""
 
+    def __init__(self):
+        # Endpoint URLs built once per run
+        base = get_api_base()
+        self.url_courses = f"{base}/api/courses"
+        self.url_leaderboard = f"{base}/api/leaderboard"
+        self.url_badges = f"{base}/api/badges"
+        self.url_admin_stats = f"{base}/api/admin/stats"
+
     def test_instructor_can_view_courses(self):
         """Instructor can view available courses."""
-        response = requests.get(
-            f"{get_api_base()}/api/courses",
+        response = get_http().get(
+            self.url_courses,
             headers=INSTRUCTOR.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
         data = response.json()
         assert "courses" in data or isinstance(data, list)
 
     def test_instructor_can_view_leaderboard(self):
         """Instructor can view the leaderboard."""
-        response = requests.get(
-            f"{get_api_base()}/api/leaderboard",
+        response = get_http().get(
+            self.url_leaderboard,
             headers=INSTRUCTOR.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
 
     def test_instructor_can_view_badges(self):
         """Instructor can view badges."""
-        response = requests.get(
-            f"{get_api_base()}/api/badges",
+        response = get_http().get(
+            self.url_badges,
             headers=INSTRUCTOR.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
 
     def test_instructor_cannot_access_admin_stats(self):
         """Instructor should NOT be able to access admin stats (403)."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=INSTRUCTOR.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 403, \
-            f"Instructor should get 403 on admin stats, got {response.status_code}"
+        status, _ = cached_get_json(self.url_admin_stats, INSTRUCTOR)
+        assert status == 403, \
+            f"Instructor should get 403 on admin stats, got {status}"
 
 
 def get_tests():
@@ -10,75 +10,63 @@ Admins should be able to:
 Tests also verify that non-admins are rejected from admin endpoints.
 """
 
-import requests
-
-from .conftest import TIMEOUT, get_api_base, log_info
+from .conftest import TIMEOUT, assert_status, cached_get_json, get_api_base, get_http, log_info
 from .profiles import ADMIN, INSTRUCTOR, STUDENT
 
 
 class TestRBACAdmin:
     """RBAC tests from admin perspective."""
 
+    def __init__(self):
+        # Endpoint URLs built once per run
+        base = get_api_base()
+        self.url_courses = f"{base}/api/courses"
+        self.url_leaderboard = f"{base}/api/leaderboard"
+        self.url_admin_stats = f"{base}/api/admin/stats"
+        self.url_api_keys = f"{base}/api/auth/api-keys"
+
     def test_admin_can_view_courses(self):
         """Admin can view available courses."""
-        response = requests.get(
-            f"{get_api_base()}/api/courses",
+        response = get_http().get(
+            self.url_courses,
             headers=ADMIN.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
 
     def test_admin_can_view_leaderboard(self):
         """Admin can view the leaderboard."""
-        response = requests.get(
-            f"{get_api_base()}/api/leaderboard",
+        response = get_http().get(
+            self.url_leaderboard,
             headers=ADMIN.headers(),
             timeout=TIMEOUT
         )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
 
     def test_admin_can_access_stats(self):
         """Admin CAN access admin stats."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=ADMIN.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200, \
-            f"Admin should get 200 on admin stats, got {response.status_code}"
-        data = response.json()
+        status, data = cached_get_json(self.url_admin_stats, ADMIN)
+        assert status == 200, \
+            f"Admin should get 200 on admin stats, got {status}"
         assert "stats" in data, "Response should contain stats"
 
     def test_student_cannot_access_admin_stats(self):
         """Student should NOT be able to access admin stats."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 403, \
-            f"Student should get 403 on admin stats, got {response.status_code}"
+        status, _ = cached_get_json(self.url_admin_stats, STUDENT)
+        assert status == 403, \
+            f"Student should get 403 on admin stats, got {status}"
 
     def test_instructor_cannot_access_admin_stats(self):
         """Instructor should NOT be able to access admin stats."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=INSTRUCTOR.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 403, \
-            f"Instructor should get 403 on admin stats, got {response.status_code}"
+        status, _ = cached_get_json(self.url_admin_stats, INSTRUCTOR)
+        assert status == 403, \
+            f"Instructor should get 403 on admin stats, got {status}"
 
     def test_admin_can_list_own_api_keys(self):
         """Admin can list their own API keys."""
-        response = requests.get(
-            f"{get_api_base()}/api/auth/api-keys",
-            headers=ADMIN.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200, \
-            f"Expected 200, got {response.status_code}"
-        data = response.json()
+        status, data = cached_get_json(self.url_api_keys, ADMIN)
+        assert status == 200, \
+            f"Expected 200, got {status}"
         assert "apiKeys" in data, "Response should contain apiKeys"
 
 
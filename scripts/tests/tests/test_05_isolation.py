@@ -7,9 +7,7 @@ Tests that student A cannot see/modify student B's data.
 Now uses distinct profiles (STUDENT, INSTRUCTOR, ADMIN) to test cross-user isolation.
 """
 
-import requests
-
-from .conftest import TIMEOUT, get_api_base, log_info
+from .conftest import TIMEOUT, assert_status, cached_get_json, get_api_base, get_http, log_info
 from .profiles import ADMIN, INSTRUCTOR, STUDENT
 
 
@@ -23,16 +21,20 @@ class TestHorizontalIsolation:
     3. API keys are scoped to their owner
     """
 
+    def __init__(self):
+        # Endpoint URLs built once per run
+        base = get_api_base()
+        self.url_signals_wge_onboarding = f"{base}/api/signals/wge-onboarding"
+        self.url_api_keys = f"{base}/api/auth/api-keys"
+        self.url_signals_reset = f"{base}/api/signals/test-course-isolation/reset"
+        self.url_learner = f"{base}/api/learner"
+        self.url_stats = f"{base}/api/stats"
+
     def test_signals_are_user_scoped(self):
         """Each user's signals should only show their own data."""
         # Get signals as student
-        response = requests.get(
-            f"{get_api_base()}/api/signals/wge-onboarding",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200
-        data = response.json()
+        status, data = cached_get_json(self.url_signals_wge_onboarding, STUDENT)
+        assert status == 200
         
         # The response should only contain the current user's signals
         if "steps" in data:
@@ -43,13 +45,13 @@ class TestHorizontalIsolation:
 
     def test_api_keys_student_sees_only_own_keys(self):
         """Student's API keys list should only show student's keys."""
-        response = requests.get(
-            f"{get_api_base()}/api/auth/api-keys",
+        response = get_http().get(
+            self.url_api_keys,
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
         
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert_status(response, 200)
         data = response.json()
         
         assert "apiKeys" in data, "Response should have apiKeys"
@@ -59,14 +61,9 @@ class TestHorizontalIsolation:
 
     def test_api_keys_admin_sees_only_own_keys(self):
         """Admin's API keys list should only show admin's keys, not all keys."""
-        response = requests.get(
-            f"{get_api_base()}/api/auth/api-keys",
-            headers=ADMIN.headers(),
-            timeout=TIMEOUT
-        )
+        status, data = cached_get_json(self.url_api_keys, ADMIN)
         
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        data = response.json()
+        assert status == 200, f"Expected 200, got {status}"
         
         assert "apiKeys" in data, "Response should have apiKeys"
         keys = data["apiKeys"]
@@ -82,20 +79,19 @@ class TestHorizontalIsolation:
         # Use a fake key ID that definitely doesn't belong to student
         fake_key_id = "ea88cdb4-aab5-4f62-a39b-c412d94cb0b7"  # instructor's key ID
         
-        response = requests.delete(
-            f"{get_api_base()}/api/auth/api-keys/{fake_key_id}",
+        response = get_http().delete(
+            f"{self.url_api_keys}/{fake_key_id}",
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
         
         # Should be 404 (not found for THIS user) - the key exists but isn't theirs
-        assert response.status_code == 404, \
-            f"Expected 404 when deleting other user's key, got {response.status_code}"
+        assert_status(response, 404)
 
     def test_signals_reset_is_user_scoped(self):
         """Signal reset should only affect current user's data."""
-        response = requests.post(
-            f"{get_api_base()}/api/signals/test-course-isolation/reset",
+        response = get_http().post(
+            self.url_signals_reset,
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
@@ -103,40 +99,34 @@ class TestHorizontalIsolation:
         # 200 if course exists and user has data
         # 404 if course doesn't exist
         # Both are acceptable - just shouldn't be 500 or reset other users
-        assert response.status_code in [200, 404], \
-            f"Expected 200/404, got {response.status_code}"
+        assert_status(response, 200, 404)
 
     def test_learner_profile_student(self):
         """Student profile should show student's own data."""
-        response = requests.get(
-            f"{get_api_base()}/api/learner",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
+        status, _ = cached_get_json(self.url_learner, STUDENT)
         
-        assert response.status_code in [200, 404]
+        assert status in [200, 404]
 
     def test_learner_profile_admin(self):
         """Admin profile should show admin's own data, not student's."""
-        response = requests.get(
-            f"{get_api_base()}/api/learner",
+        response = get_http().get(
+            self.url_learner,
             headers=ADMIN.headers(),
             timeout=TIMEOUT
         )
         
-        assert response.status_code in [200, 404]
+        assert_status(response, 200, 404)
 
     def test_stats_are_user_scoped(self):
         """User stats should be scoped to the authenticated user."""
-        response = requests.get(
-            f"{get_api_base()}/api/stats",
+        response = get_http().get(
+            self.url_stats,
             headers=STUDENT.headers(),
             timeout=TIMEOUT
         )
         
         # 200 or 404 (no stats yet) are valid
-        assert response.status_code in [200, 404], \
-            f"Expected 200/404, got {response.status_code}"
+        assert_status(response, 200, 404)
 
 
 def get_tests():
@@ -6,33 +6,34 @@ Tests for specific features from Pareto Speedruns:
 - Third Pareto: Role in session, admin stats, mastery levels
 """
 
-import requests
-
-from .conftest import TIMEOUT, get_api_base
+from .conftest import TIMEOUT, assert_status, cached_get_json, get_api_base, get_http
 from .profiles import ADMIN, STUDENT
 
 
 class TestSecondParetoFeatures:
     """Tests for Second Pareto Speedrun features."""
 
+    def __init__(self):
+        # Endpoint URLs built once per run
+        base = get_api_base()
+        self.url_signals_wge_onboarding = f"{base}/api/signals/wge-onboarding"
+        self.url_health = f"{base}/api/health"
+        self.url_events = f"{base}/api/events"
+
     def test_rate_limit_not_blocked(self):
         """Normal requests should not be rate limited (GAP-1415)."""
-        response = requests.get(
-            f"{get_api_base()}/api/health",
+        response = get_http().get(
+            self.url_health,
             timeout=TIMEOUT
         )
-        assert response.status_code == 200
+        assert_status(response, 200)
         # Just verify we're not getting 429
 
     def test_signals_include_course_progress(self):
         """GET /api/signals/:courseId should include course_progress (GAP-601)."""
-        response = requests.get(
-            f"{get_api_base()}/api/signals/wge-onboarding",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        data = response.json()
+        # Signals aggregate course_progress and video_positions: one shared fetch
+        status, data = cached_get_json(self.url_signals_wge_onboarding, STUDENT)
+        assert status == 200, f"Expected 200, got {status}"
         
         assert "course_progress" in data, "Missing course_progress in signals"
         progress = data["course_progress"]
@@ -42,21 +43,16 @@ class TestSecondParetoFeatures:
 
     def test_signals_include_video_positions(self):
         """GET /api/signals/:courseId should include video_positions (GAP-102)."""
-        response = requests.get(
-            f"{get_api_base()}/api/signals/wge-onboarding",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200
-        data = response.json()
+        status, data = cached_get_json(self.url_signals_wge_onboarding, STUDENT)
+        assert status == 200
         
         assert "video_positions" in data, "Missing video_positions in signals"
         assert isinstance(data["video_positions"], dict), "video_positions should be a dict"
 
     def test_idempotency_header_accepted(self):
         """POST /api/events should accept X-Idempotency-Key header (GAP-711)."""
-        response = requests.post(
-            f"{get_api_base()}/api/events",
+        response = get_http().post(
+            self.url_events,
             headers={
                 **STUDENT.headers(),
                 "X-Idempotency-Key": "test-key-12345"
@@ -70,44 +66,34 @@ class TestSecondParetoFeatures:
             timeout=TIMEOUT
         )
         # Should work with auth (201/200)
-        assert response.status_code in [201, 200], \
-            f"Expected 201/200, got {response.status_code}"
+        assert_status(response, 201, 200)
 
 
 class TestThirdParetoFeatures:
     """Tests for Third Pareto Speedrun features."""
 
+    def __init__(self):
+        # Endpoint URLs built once per run
+        base = get_api_base()
+        self.url_admin_stats = f"{base}/api/admin/stats"
+
     def test_student_role_resolved_correctly(self):
         """Student should get 403 on admin stats (role resolved correctly)."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=STUDENT.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 403, \
-            f"Student should get 403, got {response.status_code}"
+        status, _ = cached_get_json(self.url_admin_stats, STUDENT)
+        assert status == 403, \
+            f"Student should get 403, got {status}"
 
     def test_admin_role_resolved_correctly(self):
         """Admin should get 200 on admin stats (role resolved correctly)."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=ADMIN.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200, \
-            f"Admin should get 200, got {response.status_code}"
-        data = response.json()
+        status, data = cached_get_json(self.url_admin_stats, ADMIN)
+        assert status == 200, \
+            f"Admin should get 200, got {status}"
         assert "stats" in data, "Response should contain stats"
 
     def test_admin_stats_structure(self):
         """Admin stats should have proper structure (GAP-604)."""
-        response = requests.get(
-            f"{get_api_base()}/api/admin/stats",
-            headers=ADMIN.headers(),
-            timeout=TIMEOUT
-        )
-        assert response.status_code == 200
-        data = response.json()
+        status, data = cached_get_json(self.url_admin_stats, ADMIN)
+        assert status == 200
         
         assert "stats" in data, "Missing stats in response"
         stats = data["stats"]
@@ -6,8 +6,14 @@ Verifies no P1 (critical) entropy violations.
 """
 
 import os
+import re
 import subprocess
 
+# Summary line: "📊 Summary: 0 P1, X P2, Y P3"
+_P1_SUMMARY_RE = re.compile(r'(\d+)\s+P1')
+# P1 violation lines carry the 🔴 marker
+_P1_LINE_RE = re.compile(r'^.*🔴.*$', re.MULTILINE)
+
 
 class TestEntropy:
     """Entropy checks to ensure code stays clean."""
@@ -29,16 +35,13 @@ class TestEntropy:
         )
         
         # Check summary line for P1 count
-        # Expected format: "📊 Summary: 0 P1, X P2, Y P3"
-        import re
-        summary_match = re.search(r'(\d+)\s+P1', result.stdout)
+        summary_match = _P1_SUMMARY_RE.search(result.stdout)
         
         if summary_match:
             p1_count = int(summary_match.group(1))
             if p1_count > 0:
-                # Extract only P1 violations (🔴 markers)
-                lines = result.stdout.split('\n')
-                p1_lines = [l for l in lines if '🔴' in l]
+                # Extract only P1 violations (🔴 markers) in one scan
+                p1_lines = _P1_LINE_RE.findall(result.stdout)
                 assert False, f"P1 entropy violations found ({p1_count}):\n" + "\n".join(p1_lines)
         # P2 and P3 are acceptable (warnings/info)
 